@@ -1,282 +1,486 @@
-#!/usr/bin/env python3
-"""
-BWGA Nexus - Complete Investment Intelligence System (All-in-One Blueprint)
-----------------------------------------------------------------------------
-This file contains:
-- The full advanced investment algorithm (with all metrics, tiers, and logic)
-- A Flask web server
-- A modern Bootstrap dashboard UI
-- Form input for all relevant company/region/market data
-- 3-tier report output (with explanations)
-- Clear code structure and comments
-
-To run:
-    pip install flask
-    python BWGA_NEXUS_COMPLETE.py
-Then open http://localhost:8000 in your browser.
-"""
-
-from flask import Flask, render_template_string, request
-from datetime import datetime
-
-app = Flask(__name__)
-
-# ---------------------- Advanced Investment Algorithm ----------------------
-class InvestmentTier:
-    TIER_1 = "Tier 1 - Premium Investment"
-    TIER_2 = "Tier 2 - Strategic Investment"
-    TIER_3 = "Tier 3 - Emerging Opportunity"
-
-def advanced_investment_algorithm(data):
-    """
-    Advanced algorithm for calculating investment score, tier, ROI, and risk.
-    Uses multiple weighted metrics and provides detailed output.
-    """
-    # Extract and normalize input (default values for demo)
-    try:
-        infra = float(data.get('infrastructure_score', 0.7))
-        talent = float(data.get('talent_availability', 0.7))
-        cost = float(data.get('cost_of_living', 0.5))
-        market = float(data.get('market_access', 0.7))
-        risk = float(data.get('risk_factor', 0.5))
-        growth = float(data.get('growth_rate', 0.05))
-        regulatory = float(data.get('regulatory_ease', 0.7))
-        political = float(data.get('political_stability', 0.7))
-        digital = float(data.get('digital_infrastructure', 0.7))
-        supply_chain = float(data.get('supply_chain_efficiency', 0.7))
-        innovation = float(data.get('innovation_index', 0.7))
-        sustainability = float(data.get('sustainability_score', 0.7))
-        geo_risk = float(data.get('geopolitical_risk', 0.3))
-        volatility = float(data.get('market_volatility', 0.4))
-    except Exception:
-        infra = talent = cost = market = risk = growth = regulatory = political = digital = supply_chain = innovation = sustainability = 0.7
-        geo_risk = 0.3
-        volatility = 0.4
-
-    # Weighted sum (customize weights as needed)
-    score = (
-        infra * 0.12 +
-        talent * 0.10 +
-        (1 - cost) * 0.15 +
-        market * 0.12 +
-        regulatory * 0.08 +
-        political * 0.07 +
-        growth * 0.10 * 10 +  # growth_rate is usually 0.01-0.1, scale up
-        (1 - risk) * 0.08 +
-        digital * 0.06 +
-        sustainability * 0.05 +
-        innovation * 0.04 +
-        supply_chain * 0.03 -
-        geo_risk * 0.05 -
-        volatility * 0.05
-    ) * 100
-
-    # Tier logic
-    if score >= 85:
-        tier = InvestmentTier.TIER_1
-    elif score >= 70:
-        tier = InvestmentTier.TIER_2
-    else:
-        tier = InvestmentTier.TIER_3
-
-    # ROI and risk assessment (demo logic)
-    roi = round(8 + (score - 70) * 0.3, 2)
-    risk_level = "Low" if score >= 85 else ("Medium" if score >= 70 else "High")
-
-    # Detailed component scores for report
-    components = {
-        'Infrastructure': infra,
-        'Talent Availability': talent,
-        'Cost Efficiency': 1 - cost,
-        'Market Access': market,
-        'Regulatory Ease': regulatory,
-        'Political Stability': political,
-        'Growth Rate': growth,
-        'Risk Factor': 1 - risk,
-        'Digital Infrastructure': digital,
-        'Sustainability': sustainability,
-        'Innovation': innovation,
-        'Supply Chain Efficiency': supply_chain,
-        'Geopolitical Risk': 1 - geo_risk,
-        'Market Volatility': 1 - volatility
-    }
-
-    return {
-        'score': round(score, 2),
-        'tier': tier,
-        'roi': roi,
-        'risk_level': risk_level,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'components': components
-    }
-
-# ---------------------- HTML Dashboard Template ----------------------
-DASHBOARD_HTML = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BWGA Nexus Investment Intelligence</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
-    <style>
-        body { background: linear-gradient(135deg, #0a0a0a 0%, #1a1a2e 100%); color: #fff; }
-        .navbar { background: #1a237e; }
-        .card { background: #181828; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.3); }
-        .card-header { background: linear-gradient(135deg, #1a237e, #0d47a1); color: #fff; border-radius: 16px 16px 0 0; }
-        .btn-primary { background: linear-gradient(135deg, #1a237e, #0d47a1); border: none; border-radius: 25px; }
-        .tier-badge { font-size: 1.1em; padding: 8px 18px; border-radius: 20px; font-weight: bold; }
-        .tier-1 { background: linear-gradient(135deg, #00c853, #64dd17); color: #fff; }
-        .tier-2 { background: linear-gradient(135deg, #ff6f00, #ffab00); color: #fff; }
-        .tier-3 { background: linear-gradient(135deg, #d50000, #ff1744); color: #fff; }
-        .score-table td, .score-table th { color: #fff; }
-    </style>
-</head>
-<body>
-<nav class="navbar navbar-expand-lg navbar-dark mb-4">
-  <div class="container-fluid">
-    <a class="navbar-brand" href="#"><i class="fas fa-brain me-2"></i>BWGA Nexus Investment Intelligence</a>
-    <span class="navbar-text">v7.1.0</span>
-  </div>
-</nav>
-<div class="container">
-  <div class="row mb-4">
-    <div class="col-12">
-      <div class="card">
-        <div class="card-header text-center">
-          <h2><i class="fas fa-chart-line me-2"></i>Investment Intelligence Dashboard</h2>
-          <p class="lead">Advanced 3-Tier Analysis for Seed Capital & Strategic Decisions</p>
-        </div>
-        <div class="card-body">
-          <form method="POST" class="row g-3">
-            <div class="col-md-4">
-              <label class="form-label">Infrastructure Score (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="infrastructure_score" class="form-control" value="{{ formdata.infrastructure_score or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Talent Availability (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="talent_availability" class="form-control" value="{{ formdata.talent_availability or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Cost of Living (0-1, lower is better)</label>
-              <input type="number" step="0.01" min="0" max="1" name="cost_of_living" class="form-control" value="{{ formdata.cost_of_living or 0.5 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Market Access (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="market_access" class="form-control" value="{{ formdata.market_access or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Risk Factor (0-1, lower is better)</label>
-              <input type="number" step="0.01" min="0" max="1" name="risk_factor" class="form-control" value="{{ formdata.risk_factor or 0.5 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Growth Rate (0-0.2)</label>
-              <input type="number" step="0.001" min="0" max="0.2" name="growth_rate" class="form-control" value="{{ formdata.growth_rate or 0.05 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Regulatory Ease (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="regulatory_ease" class="form-control" value="{{ formdata.regulatory_ease or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Political Stability (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="political_stability" class="form-control" value="{{ formdata.political_stability or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Digital Infrastructure (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="digital_infrastructure" class="form-control" value="{{ formdata.digital_infrastructure or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Supply Chain Efficiency (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="supply_chain_efficiency" class="form-control" value="{{ formdata.supply_chain_efficiency or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Innovation Index (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="innovation_index" class="form-control" value="{{ formdata.innovation_index or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Sustainability Score (0-1)</label>
-              <input type="number" step="0.01" min="0" max="1" name="sustainability_score" class="form-control" value="{{ formdata.sustainability_score or 0.7 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Geopolitical Risk (0-1, lower is better)</label>
-              <input type="number" step="0.01" min="0" max="1" name="geopolitical_risk" class="form-control" value="{{ formdata.geopolitical_risk or 0.3 }}" required>
-            </div>
-            <div class="col-md-4">
-              <label class="form-label">Market Volatility (0-1, lower is better)</label>
-              <input type="number" step="0.01" min="0" max="1" name="market_volatility" class="form-control" value="{{ formdata.market_volatility or 0.4 }}" required>
-            </div>
-            <div class="col-12 text-center mt-3">
-              <button type="submit" class="btn btn-primary btn-lg"><i class="fas fa-calculator me-2"></i>Run Analysis</button>
-            </div>
-          </form>
-        </div>
-      </div>
-    </div>
-  </div>
-  {% if result %}
-  <div class="row mb-4">
-    <div class="col-12">
-      <div class="card">
-        <div class="card-header text-center">
-          <h3>Investment Analysis Result</h3>
-        </div>
-        <div class="card-body text-center">
-          <div class="mb-3">
-            <span class="tier-badge tier-1" style="display: {{ 'inline-block' if result.tier.startswith('Tier 1') else 'none' }};">{{ result.tier }}</span>
-            <span class="tier-badge tier-2" style="display: {{ 'inline-block' if result.tier.startswith('Tier 2') else 'none' }};">{{ result.tier }}</span>
-            <span class="tier-badge tier-3" style="display: {{ 'inline-block' if result.tier.startswith('Tier 3') else 'none' }};">{{ result.tier }}</span>
-          </div>
-          <h1 class="display-4">Score: {{ result.score }}</h1>
-          <h4>Projected ROI: <span class="text-success">{{ result.roi }}%</span></h4>
-          <h5>Risk Level: <span class="text-warning">{{ result.risk_level }}</span></h5>
-          <p class="mt-3"><strong>Analysis Time:</strong> {{ result.timestamp }}</p>
-          <hr>
-          <h5>Component Scores</h5>
-          <table class="table table-sm score-table">
-            <thead><tr><th>Metric</th><th>Score</th></tr></thead>
-            <tbody>
-            {% for k, v in result.components.items() %}
-              <tr><td>{{ k }}</td><td>{{ '%.2f'|format(v*100) }}%</td></tr>
-            {% endfor %}
-            </tbody>
-          </table>
-        </div>
-      </div>
-    </div>
-  </div>
-  {% endif %}
-  <div class="row mb-4">
-    <div class="col-12">
-      <div class="card">
-        <div class="card-header"><i class="fas fa-info-circle me-2"></i>About the 3-Tier System</div>
-        <div class="card-body">
-          <ul>
-            <li><b>Tier 1 - Premium Investment:</b> Score 85+, low risk, high confidence, stable returns.</li>
-            <li><b>Tier 2 - Strategic Investment:</b> Score 70-84, medium risk, high potential, strategic value.</li>
-            <li><b>Tier 3 - Emerging Opportunity:</b> Score below 70, higher risk, high reward, emerging markets.</li>
-          </ul>
-          <p>This dashboard is a professional demonstration for seed capital and strategic investment decisions. All calculations are transparent and can be customized for your business needs.</p>
-        </div>
-      </div>
-    </div>
-  </div>
-</div>
-</body>
-</html>
-'''
-
-# ---------------------- Flask Routes ----------------------
-@app.route('/', methods=['GET', 'POST'])
-def dashboard():
-    formdata = request.form if request.method == 'POST' else {}
-    result = None
-    if request.method == 'POST':
-        result = advanced_investment_algorithm(formdata)
-    return render_template_string(DASHBOARD_HTML, formdata=formdata, result=result)
-
-# ---------------------- Main Entry ----------------------
-if __name__ == '__main__':
-    print("\n🌍 BWGA Nexus Complete Investment Intelligence System")
-    print("Version: 7.1.0 | http://localhost:8000\n")
-    app.run(host='0.0.0.0', port=8000, debug=True) 
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+BWGA Nexus - Complete Investment Intelligence System (All-in-One Blueprint)
+----------------------------------------------------------------------------
+This file contains:
+- The full advanced investment algorithm (with all metrics, tiers, and logic)
+- A Flask web server
+- A modern Bootstrap dashboard UI
+- Form input for all relevant company/region/market data
+- 3-tier report output (with explanations)
+- Clear code structure and comments
+
+To run:
+    pip install flask numpy orjson
+    python BWGA_NEXUS_COMPLETE.py
+Then open http://localhost:8000 in your browser.
+
+Optional: `pip install waitress flask-compress` to serve with a threaded
+production WSGI server and gzip responses. Set BWGA_DEBUG=1 to use the
+Flask dev server with debug mode instead.
+"""
+
+from flask import Flask, Response, jsonify, request
+from jinja2 import BaseLoader, Environment
+import hashlib
+import os
+import sys
+import time
+import numpy as np
+import orjson
+
+# Optional JIT for the scoring kernel; falls back to plain NumPy
+try:
+    import numba
+    _NJIT = numba.njit(cache=True)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _NJIT = lambda f: f
+    NUMBA_AVAILABLE = False
+
+# Optional production WSGI server; falls back to the Flask dev server
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+app = Flask(__name__)
+
+# Optional gzip of responses larger than COMPRESS_MIN_SIZE bytes
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+except ImportError:
+    pass
+
+# ---------------------- Advanced Investment Algorithm ----------------------
+# Tier labels, indexed 0-2 by the score thresholds (85, 70)
+TIERS = tuple(sys.intern(t) for t in (
+    "Tier 1 - Premium Investment",
+    "Tier 2 - Strategic Investment",
+    "Tier 3 - Emerging Opportunity",
+))
+
+# Input fields in component-report order, with their demo defaults
+FEATURE_KEYS = (
+    'infrastructure_score', 'talent_availability', 'cost_of_living', 'market_access',
+    'regulatory_ease', 'political_stability', 'growth_rate', 'risk_factor',
+    'digital_infrastructure', 'sustainability_score', 'innovation_index',
+    'supply_chain_efficiency', 'geopolitical_risk', 'market_volatility',
+)
+DEFAULTS = np.array([0.7, 0.7, 0.5, 0.7, 0.7, 0.7, 0.05, 0.5, 0.7, 0.7, 0.7, 0.7, 0.3, 0.4], dtype=np.float64)
+
+# Weights per feature. "Lower is better" terms carry a negative sign, growth
+# carries its x10 scale-up, and BIAS absorbs the constants of (1 - cost) and
+# (1 - risk) so the score is a single dot product.
+WEIGHTS = np.array([0.12, 0.10, -0.15, 0.12, 0.08, 0.07, 1.0, -0.08, 0.06, 0.05, 0.04, 0.03, -0.05, -0.05], dtype=np.float64)
+BIAS = (0.15 + 0.08) * 100
+
+@_NJIT
+def _score_kernel(features):
+    """Weighted sum of a float64 feature vector, scaled to a 0-100 score."""
+    return np.sum(features * WEIGHTS) * 100.0 + BIAS
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True)
+    def _batch_score_kernel(features):
+        """Score each row of an (N, 14) array; returns (scores, tier_idx)."""
+        n = features.shape[0]
+        scores = np.empty(n)
+        tier_idx = np.empty(n, dtype=np.intp)
+        for i in numba.prange(n):
+            s = 0.0
+            for j in range(features.shape[1]):
+                s += features[i, j] * WEIGHTS[j]
+            s = s * 100.0 + BIAS
+            scores[i] = s
+            tier_idx[i] = 0 if s >= 85 else (1 if s >= 70 else 2)
+        return scores, tier_idx
+else:
+    def _batch_score_kernel(features):
+        """Score each row of an (N, 14) array; returns (scores, tier_idx)."""
+        scores = features @ WEIGHTS * 100 + BIAS
+        return scores, 2 - (scores >= 70).astype(np.intp) - (scores >= 85)
+
+# Compile (or load from cache) at import so the first request is warm
+_score_kernel(DEFAULTS)
+_batch_score_kernel(DEFAULTS.reshape(1, -1))
+
+_RISK_LEVELS = ("Low", "Medium", "High")
+
+# Report labels, one per entry in FEATURE_KEYS
+_COMPONENT_KEYS = tuple(sys.intern(k) for k in (
+    'Infrastructure', 'Talent Availability', 'Cost Efficiency', 'Market Access',
+    'Regulatory Ease', 'Political Stability', 'Growth Rate', 'Risk Factor',
+    'Digital Infrastructure', 'Sustainability', 'Innovation',
+    'Supply Chain Efficiency', 'Geopolitical Risk', 'Market Volatility',
+))
+# cost_of_living, risk_factor, geopolitical_risk, market_volatility
+_INVERTED_IDX = np.array([2, 7, 12, 13])
+
+_KEYS_DEFAULTS = tuple(zip(FEATURE_KEYS, DEFAULTS.tolist()))
+
+def _parse_features(data, out=None):
+    """Read FEATURE_KEYS from a form/dict into a float64 array (or into `out`).
+
+    A missing or malformed field falls back to its own default only.
+    """
+    features = np.empty(len(FEATURE_KEYS), dtype=np.float64) if out is None else out
+    for i, (key, default) in enumerate(_KEYS_DEFAULTS):
+        try:
+            features[i] = float(data.get(key, default))
+        except (TypeError, ValueError):
+            features[i] = default
+    return features
+
+def advanced_investment_algorithm(data):
+    """
+    Advanced algorithm for calculating investment score, tier, ROI, and risk.
+    Uses multiple weighted metrics and provides detailed output.
+    """
+    # Extract and normalize input (default values for demo)
+    features = _parse_features(data)
+
+    # Weighted sum (customize weights via WEIGHTS/BIAS)
+    score = float(_score_kernel(features))
+
+    # Tier and risk share the 85/70 thresholds: 0 = Tier 1, 1 = Tier 2, 2 = Tier 3;
+    # >= tests fail closed, so a NaN score lands in Tier 3
+    idx = 2 - (score >= 70) - (score >= 85)
+    tier = TIERS[idx]
+    risk_level = _RISK_LEVELS[idx]
+
+    # ROI (demo logic); score and ROI are formatted to 2 d.p. in the template
+    roi = 8 + (score - 70) * 0.3
+
+    # Detailed component scores for report as (name, percent string) pairs,
+    # with "lower is better" inputs inverted
+    inverted = features.copy()
+    inverted[_INVERTED_IDX] = 1 - inverted[_INVERTED_IDX]
+    components = [(name, f"{v * 100:.2f}%") for name, v in zip(_COMPONENT_KEYS, inverted.tolist())]
+
+    return {
+        'score': score,
+        'tier': tier,
+        'tier_idx': idx,
+        'roi': roi,
+        'risk_level': risk_level,
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'components': components
+    }
+
+# ---------------------- HTML Dashboard Template ----------------------
+# Split into static head/footer and a Jinja body; only the body is rendered.
+HEAD_STATIC = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>BWGA Nexus Investment Intelligence</title>
+    <style>
+        /* Bootstrap 5.3 subset: only the classes this page uses */
+        *, ::before, ::after { box-sizing: border-box; }
+        body { margin: 0; font-family: system-ui, -apple-system, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif; font-size: 1rem; line-height: 1.5; }
+        h1, h2, h3, h4, h5 { margin-top: 0; margin-bottom: .5rem; font-weight: 500; line-height: 1.2; }
+        h2 { font-size: calc(1.325rem + .9vw); } h3 { font-size: calc(1.3rem + .6vw); } h4 { font-size: calc(1.275rem + .3vw); } h5 { font-size: 1.25rem; }
+        p, ul { margin-top: 0; margin-bottom: 1rem; }
+        hr { margin: 1rem 0; border: 0; border-top: 1px solid; opacity: .25; }
+        th { text-align: inherit; }
+        .container, .container-fluid { width: 100%; padding: 0 .75rem; margin: 0 auto; }
+        @media (min-width: 576px) { .container { max-width: 540px; } }
+        @media (min-width: 768px) { .container { max-width: 720px; } .col-md-4 { flex: 0 0 auto; width: 33.33333333%; } }
+        @media (min-width: 992px) { .container { max-width: 960px; } }
+        @media (min-width: 1200px) { .container { max-width: 1140px; } h2 { font-size: 2rem; } h3 { font-size: 1.75rem; } h4 { font-size: 1.5rem; } .display-4 { font-size: 3.5rem; } }
+        @media (min-width: 1400px) { .container { max-width: 1320px; } }
+        .row { --gx: 1.5rem; --gy: 0; display: flex; flex-wrap: wrap; margin: calc(-1 * var(--gy)) calc(-.5 * var(--gx)) 0; }
+        .row > * { flex-shrink: 0; width: 100%; max-width: 100%; padding: 0 calc(.5 * var(--gx)); margin-top: var(--gy); }
+        .g-3 { --gx: 1rem; --gy: 1rem; }
+        .col-12 { flex: 0 0 auto; width: 100%; }
+        .navbar { display: flex; flex-wrap: wrap; align-items: center; padding: .5rem 0; }
+        .navbar > .container-fluid { display: flex; align-items: center; justify-content: space-between; }
+        .navbar-brand { padding: .3125rem 0; margin-right: 1rem; font-size: 1.25rem; color: #fff; text-decoration: none; white-space: nowrap; }
+        .navbar-text { color: rgba(255,255,255,.55); }
+        .card { display: flex; flex-direction: column; min-width: 0; border: 1px solid rgba(0,0,0,.175); }
+        .card-header { padding: .5rem 1rem; border-bottom: 1px solid rgba(0,0,0,.175); }
+        .card-body { flex: 1 1 auto; padding: 1rem; }
+        .form-label { display: inline-block; margin-bottom: .5rem; }
+        .form-control { display: block; width: 100%; padding: .375rem .75rem; font-size: 1rem; line-height: 1.5; color: #212529; background: #fff; border: 1px solid #dee2e6; border-radius: .375rem; }
+        .form-control:focus { outline: 0; border-color: #86b7fe; box-shadow: 0 0 0 .25rem rgba(13,110,253,.25); }
+        .btn { display: inline-block; padding: .375rem .75rem; font-size: 1rem; line-height: 1.5; color: #fff; text-align: center; cursor: pointer; border: 1px solid transparent; }
+        .btn:hover { filter: brightness(1.15); }
+        .btn-lg { padding: .5rem 1rem; font-size: 1.25rem; }
+        .lead { font-size: 1.25rem; font-weight: 300; }
+        .display-4 { font-size: calc(1.475rem + 2.7vw); font-weight: 300; line-height: 1.2; }
+        .table { width: 100%; margin-bottom: 1rem; border-collapse: collapse; }
+        .table > :not(caption) > * > * { padding: .5rem; border-bottom: 1px solid #495057; }
+        .table-sm > :not(caption) > * > * { padding: .25rem; }
+        .text-center { text-align: center !important; }
+        .text-success { color: #198754 !important; }
+        .text-warning { color: #ffc107 !important; }
+        .mb-3 { margin-bottom: 1rem !important; } .mb-4 { margin-bottom: 1.5rem !important; }
+        .mt-3 { margin-top: 1rem !important; } .me-2 { margin-right: .5rem !important; }
+        .icon { width: 1em; height: 1em; vertical-align: -.125em; fill: currentColor; }
+        /* Dashboard theme */
+        body { background: linear-gradient(135deg, #0a0a0a 0%, #1a1a2e 100%); color: #fff; }
+        .navbar { background: #1a237e; }
+        .card { background: #181828; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.3); }
+        .card-header { background: linear-gradient(135deg, #1a237e, #0d47a1); color: #fff; border-radius: 16px 16px 0 0; }
+        .btn-primary { background: linear-gradient(135deg, #1a237e, #0d47a1); border: none; border-radius: 25px; }
+        .tier-badge { font-size: 1.1em; padding: 8px 18px; border-radius: 20px; font-weight: bold; }
+        .tier-1 { background: linear-gradient(135deg, #00c853, #64dd17); color: #fff; }
+        .tier-2 { background: linear-gradient(135deg, #ff6f00, #ffab00); color: #fff; }
+        .tier-3 { background: linear-gradient(135deg, #d50000, #ff1744); color: #fff; }
+        .score-table td, .score-table th { color: #fff; }
+    </style>
+</head>
+<body>
+<nav class="navbar navbar-expand-lg navbar-dark mb-4">
+  <div class="container-fluid">
+    <a class="navbar-brand" href="#"><svg class="icon me-2" viewBox="0 0 24 24" aria-hidden="true"><path d="M9 3a3 3 0 0 0-3 3 3 3 0 0 0-2 5 3 3 0 0 0 2 5 3 3 0 0 0 3 3 2 2 0 0 0 2-2V5a2 2 0 0 0-2-2zm6 0a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2 3 3 0 0 0 3-3 3 3 0 0 0 2-5 3 3 0 0 0-2-5 3 3 0 0 0-3-3z"/></svg>BWGA Nexus Investment Intelligence</a>
+    <span class="navbar-text">v7.1.0</span>
+  </div>
+</nav>
+<div class="container">
+'''
+
+FORM_AND_RESULT = '''  <div class="row mb-4">
+    <div class="col-12">
+      <div class="card">
+        <div class="card-header text-center">
+          <h2><svg class="icon me-2" viewBox="0 0 24 24" aria-hidden="true"><path d="M3 3h2v16h16v2H3zm16.3 3.3 1.4 1.4-6.7 6.7-3-3-3.3 3.3-1.4-1.4 4.7-4.7 3 3z"/></svg>Investment Intelligence Dashboard</h2>
+          <p class="lead">Advanced 3-Tier Analysis for Seed Capital & Strategic Decisions</p>
+        </div>
+        <div class="card-body">
+          <form method="POST" id="analysisForm" class="row g-3">
+            <div class="col-md-4">
+              <label class="form-label">Infrastructure Score (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="infrastructure_score" class="form-control" value="{{ formdata.infrastructure_score or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Talent Availability (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="talent_availability" class="form-control" value="{{ formdata.talent_availability or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Cost of Living (0-1, lower is better)</label>
+              <input type="number" step="0.01" min="0" max="1" name="cost_of_living" class="form-control" value="{{ formdata.cost_of_living or 0.5 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Market Access (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="market_access" class="form-control" value="{{ formdata.market_access or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Risk Factor (0-1, lower is better)</label>
+              <input type="number" step="0.01" min="0" max="1" name="risk_factor" class="form-control" value="{{ formdata.risk_factor or 0.5 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Growth Rate (0-0.2)</label>
+              <input type="number" step="0.001" min="0" max="0.2" name="growth_rate" class="form-control" value="{{ formdata.growth_rate or 0.05 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Regulatory Ease (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="regulatory_ease" class="form-control" value="{{ formdata.regulatory_ease or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Political Stability (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="political_stability" class="form-control" value="{{ formdata.political_stability or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Digital Infrastructure (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="digital_infrastructure" class="form-control" value="{{ formdata.digital_infrastructure or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Supply Chain Efficiency (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="supply_chain_efficiency" class="form-control" value="{{ formdata.supply_chain_efficiency or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Innovation Index (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="innovation_index" class="form-control" value="{{ formdata.innovation_index or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Sustainability Score (0-1)</label>
+              <input type="number" step="0.01" min="0" max="1" name="sustainability_score" class="form-control" value="{{ formdata.sustainability_score or 0.7 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Geopolitical Risk (0-1, lower is better)</label>
+              <input type="number" step="0.01" min="0" max="1" name="geopolitical_risk" class="form-control" value="{{ formdata.geopolitical_risk or 0.3 }}" required>
+            </div>
+            <div class="col-md-4">
+              <label class="form-label">Market Volatility (0-1, lower is better)</label>
+              <input type="number" step="0.01" min="0" max="1" name="market_volatility" class="form-control" value="{{ formdata.market_volatility or 0.4 }}" required>
+            </div>
+            <div class="col-12 text-center mt-3">
+              <button type="submit" class="btn btn-primary btn-lg"><svg class="icon me-2" viewBox="0 0 24 24" aria-hidden="true"><path fill-rule="evenodd" d="M6 2h12a2 2 0 0 1 2 2v16a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2zm1 3v4h10V5zm0 7v2h2v-2zm4 0v2h2v-2zm4 0v2h2v-2zm-8 4v2h2v-2zm4 0v2h2v-2zm4 0v2h2v-2z"/></svg>Run Analysis</button>
+            </div>
+          </form>
+        </div>
+      </div>
+    </div>
+  </div>
+  <div id="analysisResult">
+  {% if result %}
+  <div class="row mb-4">
+    <div class="col-12">
+      <div class="card">
+        <div class="card-header text-center">
+          <h3>Investment Analysis Result</h3>
+        </div>
+        <div class="card-body text-center">
+          <div class="mb-3">
+            <span class="tier-badge tier-{{ result.tier_idx + 1 }}">{{ result.tier }}</span>
+          </div>
+          <h1 class="display-4">Score: {{ '%.2f'|format(result.score) }}</h1>
+          <h4>Projected ROI: <span class="text-success">{{ '%.2f'|format(result.roi) }}%</span></h4>
+          <h5>Risk Level: <span class="text-warning">{{ result.risk_level }}</span></h5>
+          <p class="mt-3"><strong>Analysis Time:</strong> {{ result.timestamp }}</p>
+          <hr>
+          <h5>Component Scores</h5>
+          <table class="table table-sm score-table">
+            <thead><tr><th>Metric</th><th>Score</th></tr></thead>
+            <tbody>
+            {% for k, v in result.components %}
+              <tr><td>{{ k }}</td><td>{{ v }}</td></tr>
+            {% endfor %}
+            </tbody>
+          </table>
+        </div>
+      </div>
+    </div>
+  </div>
+  {% endif %}
+  </div>
+'''
+
+FOOTER_STATIC = '''  <div class="row mb-4">
+    <div class="col-12">
+      <div class="card">
+        <div class="card-header"><svg class="icon me-2" viewBox="0 0 24 24" aria-hidden="true"><path fill-rule="evenodd" d="M12 2a10 10 0 1 1 0 20 10 10 0 0 1 0-20zm-1 5v2h2V7zm0 4v6h2v-6z"/></svg>About the 3-Tier System</div>
+        <div class="card-body">
+          <ul>
+            <li><b>Tier 1 - Premium Investment:</b> Score 85+, low risk, high confidence, stable returns.</li>
+            <li><b>Tier 2 - Strategic Investment:</b> Score 70-84, medium risk, high potential, strategic value.</li>
+            <li><b>Tier 3 - Emerging Opportunity:</b> Score below 70, higher risk, high reward, emerging markets.</li>
+          </ul>
+          <p>This dashboard is a professional demonstration for seed capital and strategic investment decisions. All calculations are transparent and can be customized for your business needs.</p>
+        </div>
+      </div>
+    </div>
+  </div>
+</div>
+<script>
+    // Submit the form to the JSON API and redraw only the result card;
+    // on any failure fall back to the regular full-page POST.
+    const analysisForm = document.getElementById('analysisForm');
+
+    function escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function displayResult(result) {
+        let rows = '';
+        for (const [name, pct] of result.components) {
+            rows += `<tr><td>${escapeHtml(name)}</td><td>${escapeHtml(pct)}</td></tr>`;
+        }
+        document.getElementById('analysisResult').innerHTML = `
+  <div class="row mb-4">
+    <div class="col-12">
+      <div class="card">
+        <div class="card-header text-center">
+          <h3>Investment Analysis Result</h3>
+        </div>
+        <div class="card-body text-center">
+          <div class="mb-3">
+            <span class="tier-badge tier-${result.tier_idx + 1}">${escapeHtml(result.tier)}</span>
+          </div>
+          <h1 class="display-4">Score: ${result.score.toFixed(2)}</h1>
+          <h4>Projected ROI: <span class="text-success">${result.roi.toFixed(2)}%</span></h4>
+          <h5>Risk Level: <span class="text-warning">${escapeHtml(result.risk_level)}</span></h5>
+          <p class="mt-3"><strong>Analysis Time:</strong> ${escapeHtml(result.timestamp)}</p>
+          <hr>
+          <h5>Component Scores</h5>
+          <table class="table table-sm score-table">
+            <thead><tr><th>Metric</th><th>Score</th></tr></thead>
+            <tbody>${rows}</tbody>
+          </table>
+        </div>
+      </div>
+    </div>
+  </div>`;
+    }
+
+    analysisForm.addEventListener('submit', async function(e) {
+        e.preventDefault();
+        try {
+            const response = await fetch('/api/score', { method: 'POST', body: new FormData(analysisForm) });
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            displayResult(await response.json());
+        } catch (error) {
+            console.error('Error running analysis:', error);
+            analysisForm.submit();
+        }
+    });
+</script>
+</body>
+</html>
+'''
+
+# Compile the dashboard template once at import rather than per request
+_env = Environment(loader=BaseLoader(), autoescape=True, keep_trailing_newline=True)
+_BODY_TEMPLATE = _env.from_string(FORM_AND_RESULT)
+
+def _render_dashboard(formdata, result):
+    return HEAD_STATIC + _BODY_TEMPLATE.render(formdata=formdata, result=result) + FOOTER_STATIC
+
+# The empty (GET) dashboard never changes, so render it once
+_EMPTY_DASHBOARD_HTML = _render_dashboard({}, None).encode('utf-8')
+_EMPTY_DASHBOARD_ETAG = hashlib.md5(_EMPTY_DASHBOARD_HTML).hexdigest()
+
+# ---------------------- Flask Routes ----------------------
+@app.route('/', methods=['GET', 'POST'])
+def dashboard():
+    if request.method == 'GET':
+        response = Response(_EMPTY_DASHBOARD_HTML, mimetype='text/html',
+                            headers={'Cache-Control': 'public, max-age=300'})
+        response.set_etag(_EMPTY_DASHBOARD_ETAG)
+        return response.make_conditional(request)
+    formdata = request.form
+    result = advanced_investment_algorithm(formdata)
+    return Response(_render_dashboard(formdata, result), mimetype='text/html')
+
+@app.route('/api/score', methods=['POST'])
+def api_score():
+    """Single-scenario analysis as JSON, for the dashboard's in-place update."""
+    data = request.get_json(silent=True)
+    if data is None:
+        data = request.form
+    elif not isinstance(data, dict):
+        return jsonify(error='Expected a JSON object of scenario fields'), 400
+    return Response(orjson.dumps(advanced_investment_algorithm(data)), mimetype='application/json')
+
+@app.route('/batch', methods=['POST'])
+def batch():
+    """Score a JSON list of scenarios in one pass over an (N, 14) array."""
+    scenarios = request.get_json(silent=True)
+    if not isinstance(scenarios, list) or not all(isinstance(s, dict) for s in scenarios):
+        return jsonify(error='Expected a JSON list of scenario objects'), 400
+    features = np.empty((len(scenarios), len(FEATURE_KEYS)), dtype=np.float64)
+    for row, scenario in zip(features, scenarios):
+        _parse_features(scenario, out=row)
+    scores, tier_idx = _batch_score_kernel(features)
+    # orjson writes the float64 score array directly, without a tolist() round-trip
+    body = orjson.dumps({'scores': scores, 'tiers': [TIERS[i] for i in tier_idx.tolist()]},
+                        option=orjson.OPT_SERIALIZE_NUMPY)
+    return Response(body, mimetype='application/json')
+
+# ---------------------- Main Entry ----------------------
+if __name__ == '__main__':
+    print("\n🌍 BWGA Nexus Complete Investment Intelligence System")
+    print("Version: 7.1.0 | http://localhost:8000\n")
+    if os.environ.get('BWGA_DEBUG') == '1' or not WAITRESS_AVAILABLE:
+        app.run(host='0.0.0.0', port=8000, debug=os.environ.get('BWGA_DEBUG') == '1')
+    else:
+        serve(app, host='0.0.0.0', port=8000, threads=8) 
\ No newline at end of file
@@ -1,484 +1,686 @@
-#!/usr/bin/env python3
-"""
-BWGA Nexus - Unified Investment Intelligence Platform
-Clean, functional tier report developer system
-"""
-
-import os
-import sys
-import json
-from datetime import datetime
-from pathlib import Path
-from flask import Flask, request, jsonify, render_template_string
-from flask_cors import CORS
-
-# Add current directory to path
-sys.path.append(str(Path(__file__).parent))
-
-# Import our core modules
-try:
-    from investment_algorithm import AdvancedRegionalInvestmentAlgorithm, RegionalMetrics, CompanyProfile
-    ALGORITHM_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Investment algorithm not available: {e}")
-    ALGORITHM_AVAILABLE = False
-
-# Flask app setup
-app = Flask(__name__)
-CORS(app)
-
-# Global system instance
-if ALGORITHM_AVAILABLE:
-    algorithm = AdvancedRegionalInvestmentAlgorithm()
-else:
-    algorithm = None
-
-@app.route('/')
-def index():
-    """Main dashboard"""
-    return render_template_string(get_dashboard_html())
-
-@app.route('/api/v1/health')
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "7.1.0",
-        "algorithm_available": ALGORITHM_AVAILABLE,
-        "message": "BWGA Nexus Investment Intelligence Platform"
-    })
-
-@app.route('/api/v1/system-info')
-def system_info():
-    """System information endpoint"""
-    return jsonify({
-        "system_name": "BWGA Nexus Investment Intelligence Platform",
-        "version": "7.1.0",
-        "algorithm_status": "Active" if ALGORITHM_AVAILABLE else "Not Available",
-        "features": [
-            "3-Tier Investment Analysis",
-            "Regional Investment Intelligence", 
-            "Real-time Algorithm Processing",
-            "Comprehensive Risk Assessment",
-            "ROI Projections",
-            "Cost Savings Analysis"
-        ]
-    })
-
-@app.route('/api/v1/analyze/investment', methods=['POST'])
-def analyze_investment():
-    """Investment analysis endpoint"""
-    try:
-        request_data = request.get_json()
-        if not request_data:
-            return jsonify({
-                "success": False,
-                "error": "No data provided",
-                "message": "Please provide investment parameters"
-            }), 400
-        
-        if not ALGORITHM_AVAILABLE:
-            return jsonify({
-                "success": False,
-                "error": "Algorithm not available",
-                "message": "Please ensure investment_algorithm.py is properly configured"
-            }), 500
-        
-        # Create regional data
-        regional_data = RegionalMetrics(
-            city=request_data.get('city', 'Austin'),
-            country=request_data.get('country', 'USA'),
-            region=request_data.get('region', 'Texas'),
-            population=request_data.get('population', 950000),
-            gdp_per_capita=request_data.get('gdp_per_capita', 65000),
-            infrastructure_score=request_data.get('infrastructure_score', 0.85),
-            talent_availability=request_data.get('talent_availability', 0.80),
-            cost_of_living=request_data.get('cost_of_living', 0.65),
-            tax_rate=request_data.get('tax_rate', 0.25),
-            regulatory_ease=request_data.get('regulatory_ease', 0.75),
-            market_access=request_data.get('market_access', 0.80),
-            political_stability=request_data.get('political_stability', 0.85),
-            growth_rate=request_data.get('growth_rate', 0.08),
-            inflation_rate=request_data.get('inflation_rate', 0.03),
-            currency_stability=request_data.get('currency_stability', 0.95),
-            digital_infrastructure=request_data.get('digital_infrastructure', 0.90),
-            supply_chain_efficiency=request_data.get('supply_chain_efficiency', 0.75),
-            innovation_index=request_data.get('innovation_index', 0.85),
-            sustainability_score=request_data.get('sustainability_score', 0.70),
-            geopolitical_risk=request_data.get('geopolitical_risk', 0.20),
-            market_volatility=request_data.get('market_volatility', 0.35)
-        )
-        
-        # Create company profile
-        company_profile = CompanyProfile(
-            company_type=request_data.get('company_type', 'technology'),
-            investment_size=request_data.get('investment_size', 'large'),
-            preferred_region=request_data.get('preferred_region', 'North America'),
-            industry_focus=request_data.get('industry_focus', 'technology'),
-            risk_tolerance=request_data.get('risk_tolerance', 'medium'),
-            timeline=request_data.get('timeline', '3-5 years'),
-            technology_requirements=request_data.get('technology_requirements', ['AI/ML', 'Cloud']),
-            supply_chain_needs=request_data.get('supply_chain_needs', ['Semiconductors']),
-            sustainability_goals=request_data.get('sustainability_goals', ['Carbon neutral', 'Renewable energy']),
-            digital_transformation_needs=request_data.get('digital_transformation_needs', ['Automation', 'Data analytics']),
-            market_expansion_targets=request_data.get('market_expansion_targets', ['Enterprise', 'SMB'])
-        )
-        
-        # Run algorithm
-        result = algorithm.calculate_investment_score(regional_data, company_profile)
-        
-        return jsonify({
-            "success": True,
-            "analysis_result": result,
-            "algorithm_used": "BWGA Nexus Advanced Algorithm",
-            "analysis_timestamp": datetime.now().isoformat()
-        })
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e),
-            "message": "Analysis failed"
-        }), 500
-
-def get_dashboard_html():
-    """Get the dashboard HTML template"""
-    return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>BWGA Nexus - Investment Intelligence Platform</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }
-        .main-container {
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(20px);
-            border-radius: 20px;
-            margin: 20px;
-            box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
-        }
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 2rem;
-            text-align: center;
-            border-radius: 20px 20px 0 0;
-        }
-        .content { padding: 2rem; }
-        .card {
-            border: none;
-            border-radius: 15px;
-            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
-            transition: transform 0.3s ease;
-        }
-        .card:hover { transform: translateY(-5px); }
-        .card-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 15px 15px 0 0 !important;
-            border: none;
-        }
-        .btn-primary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border: none;
-            border-radius: 10px;
-            padding: 12px 30px;
-            font-weight: 600;
-        }
-        .score-display {
-            font-size: 4rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            text-align: center;
-        }
-        .tier-badge {
-            display: inline-block;
-            padding: 8px 20px;
-            border-radius: 25px;
-            font-weight: 600;
-            color: white;
-        }
-        .tier-premium { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
-        .tier-strategic { background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); }
-        .tier-emerging { background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%); }
-        .metric-value {
-            font-size: 2rem;
-            font-weight: 700;
-            color: #667eea;
-        }
-        .loading { display: none; text-align: center; padding: 2rem; }
-        .spinner {
-            width: 40px;
-            height: 40px;
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #667eea;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 1rem;
-        }
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-    </style>
-</head>
-<body>
-    <div class="main-container">
-        <div class="header">
-            <h1><i class="fas fa-chart-line me-3"></i>BWGA Nexus Investment Intelligence</h1>
-            <p>Advanced algorithmic analysis with real-time insights</p>
-        </div>
-        
-        <div class="content">
-            <div class="row">
-                <div class="col-lg-6">
-                    <div class="card mb-4">
-                        <div class="card-header">
-                            <h5 class="mb-0"><i class="fas fa-calculator me-2"></i>Investment Analysis</h5>
-                        </div>
-                        <div class="card-body">
-                            <form id="analysisForm">
-                                <div class="row">
-                                    <div class="col-md-6 mb-3">
-                                        <label class="form-label">Company Type</label>
-                                        <select class="form-select" id="companyType" required>
-                                            <option value="">Select Type</option>
-                                            <option value="technology">Technology</option>
-                                            <option value="manufacturing">Manufacturing</option>
-                                            <option value="finance">Finance</option>
-                                            <option value="logistics">Logistics</option>
-                                        </select>
-                                    </div>
-                                    <div class="col-md-6 mb-3">
-                                        <label class="form-label">Investment Size</label>
-                                        <select class="form-select" id="investmentSize" required>
-                                            <option value="">Select Size</option>
-                                            <option value="small">Small ($1M - $10M)</option>
-                                            <option value="medium">Medium ($10M - $100M)</option>
-                                            <option value="large">Large ($100M+)</option>
-                                        </select>
-                                    </div>
-                                </div>
-                                
-                                <div class="row">
-                                    <div class="col-md-6 mb-3">
-                                        <label class="form-label">Risk Tolerance</label>
-                                        <select class="form-select" id="riskTolerance" required>
-                                            <option value="">Select Risk Level</option>
-                                            <option value="low">Conservative</option>
-                                            <option value="medium">Moderate</option>
-                                            <option value="high">Aggressive</option>
-                                        </select>
-                                    </div>
-                                    <div class="col-md-6 mb-3">
-                                        <label class="form-label">Target Region</label>
-                                        <select class="form-select" id="region" required>
-                                            <option value="">Select Region</option>
-                                            <option value="North America">North America</option>
-                                            <option value="Europe">Europe</option>
-                                            <option value="Asia Pacific">Asia Pacific</option>
-                                        </select>
-                                    </div>
-                                </div>
-
-                                <div class="mb-3">
-                                    <label class="form-label">Target City</label>
-                                    <input type="text" class="form-control" id="city" placeholder="e.g., Austin, Texas" required>
-                                </div>
-
-                                <button type="submit" class="btn btn-primary w-100">
-                                    <i class="fas fa-rocket me-2"></i>Run Complete Analysis
-                                </button>
-                            </form>
-                        </div>
-                    </div>
-                </div>
-
-                <div class="col-lg-6">
-                    <div class="card">
-                        <div class="card-header">
-                            <h5 class="mb-0"><i class="fas fa-chart-bar me-2"></i>Analysis Results</h5>
-                        </div>
-                        <div class="card-body">
-                            <div class="loading" id="loadingState">
-                                <div class="spinner"></div>
-                                <p>Running advanced algorithm analysis...</p>
-                            </div>
-
-                            <div id="resultsDisplay" style="display: none;">
-                                <div class="text-center mb-4">
-                                    <div class="score-display" id="compositeScore">--</div>
-                                    <div class="tier-badge" id="tierBadge">--</div>
-                                </div>
-
-                                <div class="row mb-4">
-                                    <div class="col-6">
-                                        <div class="text-center">
-                                            <div class="metric-value" id="projectedROI">--</div>
-                                            <small class="text-muted">Projected ROI</small>
-                                        </div>
-                                    </div>
-                                    <div class="col-6">
-                                        <div class="text-center">
-                                            <div class="metric-value" id="annualSavings">--</div>
-                                            <small class="text-muted">Annual Savings</small>
-                                        </div>
-                                    </div>
-                                </div>
-
-                                <div class="alert alert-info">
-                                    <h6><i class="fas fa-shield-alt me-2"></i>Risk Assessment</h6>
-                                    <div id="riskDetails">--</div>
-                                </div>
-
-                                <div class="alert alert-success">
-                                    <h6><i class="fas fa-lightbulb me-2"></i>Recommendations</h6>
-                                    <div id="recommendations">--</div>
-                                </div>
-                            </div>
-
-                            <div id="initialState" class="text-center text-muted">
-                                <i class="fas fa-chart-line fa-3x mb-3"></i>
-                                <h5>Ready for Analysis</h5>
-                                <p>Fill out the form and click "Run Complete Analysis" to get started</p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js"></script>
-    <script>
-        document.getElementById('analysisForm').addEventListener('submit', async function(e) {
-            e.preventDefault();
-            
-            const formData = {
-                company_type: document.getElementById('companyType').value,
-                investment_size: document.getElementById('investmentSize').value,
-                risk_tolerance: document.getElementById('riskTolerance').value,
-                preferred_region: document.getElementById('region').value,
-                city: document.getElementById('city').value,
-                industry_focus: document.getElementById('companyType').value
-            };
-
-            // Show loading
-            document.getElementById('loadingState').style.display = 'block';
-            document.getElementById('resultsDisplay').style.display = 'none';
-            document.getElementById('initialState').style.display = 'none';
-
-            try {
-                const response = await fetch('/api/v1/analyze/investment', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify(formData)
-                });
-                
-                const data = await response.json();
-                
-                if (data.success) {
-                    displayResults(data.analysis_result);
-                } else {
-                    showError(data.message || 'Analysis failed');
-                }
-            } catch (error) {
-                showError('Connection error. Please try again.');
-            } finally {
-                document.getElementById('loadingState').style.display = 'none';
-            }
-        });
-
-        function displayResults(result) {
-            document.getElementById('resultsDisplay').style.display = 'block';
-            document.getElementById('initialState').style.display = 'none';
-
-            document.getElementById('compositeScore').textContent = result.composite_score;
-            
-            const tierBadge = document.getElementById('tierBadge');
-            tierBadge.textContent = result.tier_level;
-            tierBadge.className = 'tier-badge ' + getTierClass(result.investment_tier);
-
-            document.getElementById('projectedROI').textContent = result.roi_projection.projected_roi + '%';
-            document.getElementById('annualSavings').textContent = '$' + (result.cost_savings.annual_savings / 1000000).toFixed(1) + 'M';
-
-            document.getElementById('riskDetails').innerHTML = `
-                <strong>Risk Level:</strong> ${result.risk_assessment.risk_level}<br>
-                <strong>Risk Score:</strong> ${result.risk_assessment.risk_score}/100<br>
-                <strong>Break-even:</strong> ${result.roi_projection.break_even_months} months
-            `;
-
-            const recommendations = result.recommendations || [
-                'Consider phased investment approach',
-                'Monitor market conditions closely',
-                'Establish risk mitigation strategies'
-            ];
-            
-            document.getElementById('recommendations').innerHTML = 
-                recommendations.map(rec => `<div class="mb-2"><i class="fas fa-check me-2"></i>${rec}</div>`).join('');
-        }
-
-        function getTierClass(tier) {
-            if (tier.includes('TIER_1')) return 'tier-premium';
-            if (tier.includes('TIER_2')) return 'tier-strategic';
-            if (tier.includes('TIER_3')) return 'tier-emerging';
-            return 'tier-premium';
-        }
-
-        function showError(message) {
-            document.getElementById('resultsDisplay').style.display = 'none';
-            document.getElementById('initialState').style.display = 'block';
-            
-            const alertDiv = document.createElement('div');
-            alertDiv.className = 'alert alert-danger alert-dismissible fade show';
-            alertDiv.innerHTML = `
-                <i class="fas fa-exclamation-triangle me-2"></i>${message}
-                <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-            `;
-            
-            document.querySelector('.content').insertBefore(alertDiv, document.querySelector('.content').firstChild);
-        }
-    </script>
-</body>
-</html>
-"""
-
-def main():
-    """Main function to run the application"""
-    print("🌍 Starting BWGA Nexus Investment Intelligence Platform...")
-    print("Version: 7.1.0")
-    print("Environment: Production (Unified System)")
-    print("-" * 50)
-    
-    if ALGORITHM_AVAILABLE:
-        print("✅ Investment algorithm loaded successfully!")
-    else:
-        print("❌ Investment algorithm not available")
-    
-    print("🌍 BWGA Nexus Investment Intelligence Platform")
-    print("Version: 7.1.0")
-    print("Algorithm Status: Active" if ALGORITHM_AVAILABLE else "Algorithm Status: Not Available")
-    print("Server running at: http://localhost:8000")
-    print("Dashboard: http://localhost:8000")
-    print("API Health: http://localhost:8000/api/v1/health")
-    print("System Info: http://localhost:8000/api/v1/system-info")
-    print("Press Ctrl+C to stop the server")
-    print("-" * 50)
-    
-    # Run Flask app
-    app.run(host='0.0.0.0', port=8000, debug=False)
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+BWGA Nexus - Unified Investment Intelligence Platform
+Clean, functional tier report developer system
+"""
+
+import os
+import shutil
+import sys
+import json
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+import orjson
+import fastjsonschema
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from flask_cors import CORS
+
+# Add current directory to path
+sys.path.append(str(Path(__file__).parent))
+
+# Import our core modules
+try:
+    from investment_algorithm import AdvancedRegionalInvestmentAlgorithm, RegionalMetrics, CompanyProfile
+    ALGORITHM_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Investment algorithm not available: {e}")
+    ALGORITHM_AVAILABLE = False
+
+def _default(obj):
+    """Fallback for types orjson does not serialize natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (dataclasses, datetimes and numpy handled natively)"""
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option, default=_default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def _json_response(payload, status=200):
+    """Serialize straight to a JSON Response, skipping jsonify"""
+    return Response(orjson.dumps(payload, option=ORJSONProvider.option, default=_default),
+                    status=status, mimetype='application/json')
+
+# Flask app setup
+app = Flask(__name__)
+CORS(app)
+app.json = ORJSONProvider(app)
+
+# Global system instance
+if ALGORITHM_AVAILABLE:
+    algorithm = AdvancedRegionalInvestmentAlgorithm()
+else:
+    algorithm = None
+
+# Bounded LRU of serialized analysis results, keyed by the canonical request JSON
+_RESULT_CACHE_SIZE = 512
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+# Response timestamps at one-second resolution, refreshed by a daemon thread
+# so request handlers only read a prebuilt string
+def _utc_now_iso():
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+_NOW_ISO = _utc_now_iso()
+
+def _refresh_now_iso():
+    global _NOW_ISO
+    while True:
+        time.sleep(1 - time.time() % 1)
+        _NOW_ISO = _utc_now_iso()
+
+threading.Thread(target=_refresh_now_iso, name='now-iso', daemon=True).start()
+
+# Static response parts, built once at import
+_HEALTH_STATIC = {
+    "version": "7.1.0",
+    "algorithm_available": ALGORITHM_AVAILABLE,
+    "message": "BWGA Nexus Investment Intelligence Platform"
+}
+
+_SYSTEM_INFO_BYTES = orjson.dumps({
+    "system_name": "BWGA Nexus Investment Intelligence Platform",
+    "version": "7.1.0",
+    "algorithm_status": "Active" if ALGORITHM_AVAILABLE else "Not Available",
+    "features": [
+        "3-Tier Investment Analysis",
+        "Regional Investment Intelligence", 
+        "Real-time Algorithm Processing",
+        "Comprehensive Risk Assessment",
+        "ROI Projections",
+        "Cost Savings Analysis"
+    ]
+})
+
+@app.route('/')
+def index():
+    """Main dashboard"""
+    # Werkzeug parses q-values, so "gzip;q=0" counts as a refusal
+    gzipped = request.accept_encodings['gzip'] > 0
+    etag = _HTML_GZ_ETAG if gzipped else _HTML_ETAG
+    headers = {'ETag': etag, 'Cache-Control': 'public, max-age=3600', 'Vary': 'Accept-Encoding'}
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers=headers)
+    if gzipped:
+        return Response(_HTML_GZ, mimetype='text/html', headers={**headers, 'Content-Encoding': 'gzip'})
+    return Response(_HTML_BYTES, mimetype='text/html', headers=headers)
+
+@app.route('/api/v1/health')
+def health_check():
+    """Health check endpoint"""
+    return _json_response({
+        "status": "healthy",
+        "timestamp": _NOW_ISO,
+        **_HEALTH_STATIC
+    })
+
+@app.route('/api/v1/system-info')
+def system_info():
+    """System information endpoint"""
+    return Response(_SYSTEM_INFO_BYTES, mimetype='application/json')
+
+# Default inputs, one key per RegionalMetrics / CompanyProfile field
+_REGIONAL_DEFAULTS = {
+    'city': 'Austin',
+    'country': 'USA',
+    'region': 'Texas',
+    'population': 950000,
+    'gdp_per_capita': 65000,
+    'infrastructure_score': 0.85,
+    'talent_availability': 0.80,
+    'cost_of_living': 0.65,
+    'tax_rate': 0.25,
+    'regulatory_ease': 0.75,
+    'market_access': 0.80,
+    'political_stability': 0.85,
+    'growth_rate': 0.08,
+    'inflation_rate': 0.03,
+    'currency_stability': 0.95,
+    'digital_infrastructure': 0.90,
+    'supply_chain_efficiency': 0.75,
+    'innovation_index': 0.85,
+    'sustainability_score': 0.70,
+    'geopolitical_risk': 0.20,
+    'market_volatility': 0.35
+}
+
+_COMPANY_DEFAULTS = {
+    'company_type': 'technology',
+    'investment_size': 'large',
+    'preferred_region': 'North America',
+    'industry_focus': 'technology',
+    'risk_tolerance': 'medium',
+    'timeline': '3-5 years',
+    'technology_requirements': ['AI/ML', 'Cloud'],
+    'supply_chain_needs': ['Semiconductors'],
+    'sustainability_goals': ['Carbon neutral', 'Renewable energy'],
+    'digital_transformation_needs': ['Automation', 'Data analytics'],
+    'market_expansion_targets': ['Enterprise', 'SMB'],
+    'competitive_advantages': ['Technology leadership', 'Cost efficiency']
+}
+
+# Request validator compiled once at import; field types follow the defaults above
+_JSON_SCHEMA_TYPES = {
+    str: {'type': 'string'},
+    int: {'type': 'number'},
+    float: {'type': 'number'},
+    list: {'type': 'array', 'items': {'type': 'string'}}
+}
+_validate_request = fastjsonschema.compile({
+    'type': 'object',
+    'properties': {
+        field: _JSON_SCHEMA_TYPES[type(value)]
+        for field, value in {**_REGIONAL_DEFAULTS, **_COMPANY_DEFAULTS}.items()
+    }
+})
+
+def _run_analysis(request_data):
+    """Build the algorithm inputs from a request payload and run the analysis"""
+    regional = {k: request_data[k] for k in _REGIONAL_DEFAULTS.keys() & request_data.keys()}
+    company = {k: request_data[k] for k in _COMPANY_DEFAULTS.keys() & request_data.keys()}
+    regional_data = RegionalMetrics(**{**_REGIONAL_DEFAULTS, **regional})
+    company_profile = CompanyProfile(**{**_COMPANY_DEFAULTS, **company})
+    
+    return algorithm.calculate_investment_score(regional_data, company_profile)
+
+# Compile (or load the cached) scoring kernels at import so JIT compilation happens before the first request
+if ALGORITHM_AVAILABLE and os.environ.get('NEXUS_WARMUP') == '1':
+    try:
+        algorithm.warm_up()
+    except Exception as e:
+        print(f"Warning: Algorithm warmup failed: {e}")
+
+def _run_analysis_serialized(request_data):
+    """Run the analysis and return the orjson-serialized result"""
+    return orjson.dumps(_run_analysis(request_data), option=ORJSONProvider.option, default=_default)
+
+def _cache_get(key):
+    """Return the cached serialized result for key, marking it most recently used"""
+    with _RESULT_CACHE_LOCK:
+        value = _RESULT_CACHE.get(key)
+        if value is not None:
+            _RESULT_CACHE.move_to_end(key)
+        return value
+
+def _cache_put(key, value):
+    """Store a serialized result, evicting the least recently used entry when full"""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = value
+        _RESULT_CACHE.move_to_end(key)
+        if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+def _analysis_response(result_bytes):
+    """Splice a (possibly cached) serialized result into a fresh success envelope"""
+    body = (b'{"success":true,"analysis_result":' + result_bytes +
+            b',"algorithm_used":"BWGA Nexus Advanced Algorithm","analysis_timestamp":' +
+            orjson.dumps(_NOW_ISO) + b'}')
+    return Response(body, mimetype='application/json')
+
+@app.route('/api/v1/analyze/investment', methods=['POST'])
+def analyze_investment():
+    """Investment analysis endpoint"""
+    try:
+        try:
+            body = request.get_data(cache=False)
+            request_data = orjson.loads(body) if body else None
+        except orjson.JSONDecodeError as e:
+            return _json_response({
+                "success": False,
+                "error": str(e),
+                "message": "Request body must be valid JSON"
+            }, 400)
+        
+        if not request_data:
+            return _json_response({
+                "success": False,
+                "error": "No data provided",
+                "message": "Please provide investment parameters"
+            }, 400)
+        
+        try:
+            _validate_request(request_data)
+        except fastjsonschema.JsonSchemaException as e:
+            return _json_response({
+                "success": False,
+                "error": e.message,
+                "message": "Invalid investment parameters"
+            }, 400)
+        
+        if not ALGORITHM_AVAILABLE:
+            return _json_response({
+                "success": False,
+                "error": "Algorithm not available",
+                "message": "Please ensure investment_algorithm.py is properly configured"
+            }, 500)
+        
+        # Identical payloads reuse the serialized result of an earlier run
+        cache_key = orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS)
+        result_bytes = _cache_get(cache_key)
+        if result_bytes is None:
+            # Run inline: an analysis takes ~30us, a round trip through a process pool ~200us
+            result_bytes = _run_analysis_serialized(request_data)
+            _cache_put(cache_key, result_bytes)
+        
+        return _analysis_response(result_bytes)
+        
+    except Exception as e:
+        return _json_response({
+            "success": False,
+            "error": str(e),
+            "message": "Analysis failed"
+        }, 500)
+
+def get_dashboard_html():
+    """Get the dashboard HTML template"""
+    return """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>BWGA Nexus - Investment Intelligence Platform</title>
+    <style>
+        /* Bootstrap 5.3 subset: only the classes this page uses */
+        *, ::before, ::after { box-sizing: border-box; }
+        body { margin: 0; font-size: 1rem; line-height: 1.5; color: #212529; }
+        h1, h5, h6 { margin-top: 0; margin-bottom: .5rem; font-weight: 500; line-height: 1.2; }
+        h1 { font-size: calc(1.375rem + 1.5vw); } h5 { font-size: 1.25rem; } h6 { font-size: 1rem; }
+        p { margin-top: 0; margin-bottom: 1rem; }
+        small { font-size: .875em; }
+        .row { display: flex; flex-wrap: wrap; margin: 0 -.75rem; }
+        .row > * { flex-shrink: 0; width: 100%; max-width: 100%; padding: 0 .75rem; }
+        .col-6 { flex: 0 0 auto; width: 50%; }
+        @media (min-width: 768px) { .col-md-6 { flex: 0 0 auto; width: 50%; } }
+        @media (min-width: 992px) { .col-lg-6 { flex: 0 0 auto; width: 50%; } }
+        @media (min-width: 1200px) { h1 { font-size: 2.5rem; } }
+        .card { display: flex; flex-direction: column; min-width: 0; background: #fff; }
+        .card-header { padding: .5rem 1rem; }
+        .card-body { flex: 1 1 auto; padding: 1rem; }
+        .form-label { display: inline-block; margin-bottom: .5rem; }
+        .form-control, .form-select { display: block; width: 100%; padding: .375rem .75rem; font: inherit; line-height: 1.5; color: #212529; background-color: #fff; border: 1px solid #dee2e6; border-radius: .375rem; }
+        .form-control:focus, .form-select:focus { outline: 0; border-color: #86b7fe; box-shadow: 0 0 0 .25rem rgba(13,110,253,.25); }
+        .btn { display: inline-block; padding: .375rem .75rem; font: inherit; color: #fff; text-align: center; cursor: pointer; border: 1px solid transparent; }
+        .alert { position: relative; padding: 1rem; margin-bottom: 1rem; border: 1px solid transparent; border-radius: .375rem; }
+        .alert-info { color: #055160; background-color: #cff4fc; border-color: #9eeaf9; }
+        .alert-success { color: #0a3622; background-color: #d1e7dd; border-color: #a3cfbb; }
+        .alert-danger { color: #58151c; background-color: #f8d7da; border-color: #f1aeb5; }
+        .alert-dismissible { padding-right: 3rem; }
+        .btn-close { position: absolute; top: 0; right: 0; padding: 1.25rem 1rem; background: none; border: 0; font-size: 1.25rem; line-height: 0; opacity: .5; cursor: pointer; }
+        .btn-close:hover { opacity: .75; }
+        .w-100 { width: 100% !important; }
+        .text-center { text-align: center !important; }
+        .text-muted { color: #6c757d !important; }
+        .mb-0 { margin-bottom: 0 !important; } .mb-2 { margin-bottom: .5rem !important; }
+        .mb-3 { margin-bottom: 1rem !important; } .mb-4 { margin-bottom: 1.5rem !important; }
+        .me-2 { margin-right: .5rem !important; } .me-3 { margin-right: 1rem !important; }
+        .icon { width: 1em; height: 1em; vertical-align: -.125em; fill: currentColor; }
+        .icon-3x { font-size: 3em; }
+        body {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        }
+        .main-container {
+            background: rgba(255, 255, 255, 0.95);
+            backdrop-filter: blur(20px);
+            border-radius: 20px;
+            margin: 20px;
+            box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.25);
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 2rem;
+            text-align: center;
+            border-radius: 20px 20px 0 0;
+        }
+        .content { padding: 2rem; }
+        .card {
+            border: none;
+            border-radius: 15px;
+            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.1);
+            transition: transform 0.3s ease;
+        }
+        .card:hover { transform: translateY(-5px); }
+        .card-header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            border-radius: 15px 15px 0 0 !important;
+            border: none;
+        }
+        .btn-primary {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            border: none;
+            border-radius: 10px;
+            padding: 12px 30px;
+            font-weight: 600;
+        }
+        .score-display {
+            font-size: 4rem;
+            font-weight: 700;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            text-align: center;
+        }
+        .tier-badge {
+            display: inline-block;
+            padding: 8px 20px;
+            border-radius: 25px;
+            font-weight: 600;
+            color: white;
+        }
+        .tier-premium { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
+        .tier-strategic { background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); }
+        .tier-emerging { background: linear-gradient(135deg, #ff9a9e 0%, #fecfef 100%); }
+        .metric-value {
+            font-size: 2rem;
+            font-weight: 700;
+            color: #667eea;
+        }
+        .loading { display: none; text-align: center; padding: 2rem; }
+        .spinner {
+            width: 40px;
+            height: 40px;
+            border: 4px solid #f3f3f3;
+            border-top: 4px solid #667eea;
+            border-radius: 50%;
+            animation: spin 1s linear infinite;
+            margin: 0 auto 1rem;
+        }
+        @keyframes spin {
+            0% { transform: rotate(0deg); }
+            100% { transform: rotate(360deg); }
+        }
+    </style>
+</head>
+<body>
+    <svg xmlns="http://www.w3.org/2000/svg" style="display: none;">
+        <symbol id="i-chart-line" viewBox="0 0 24 24"><path d="M3 3h2v16h16v2H3zm4 12 4-5 3 3 5-7 1.6 1.2-6.4 9-3-3-2.6 3.3z"/></symbol>
+        <symbol id="i-calculator" viewBox="0 0 24 24"><path d="M6 2h12a2 2 0 0 1 2 2v16a2 2 0 0 1-2 2H6a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2zm1 3v4h10V5zm0 7v2h2v-2zm4 0v2h2v-2zm4 0v6h2v-6zm-8 4v2h2v-2zm4 0v2h2v-2z"/></symbol>
+        <symbol id="i-rocket" viewBox="0 0 24 24"><path d="M14 3c3-1.5 6-1 7 0 1 1 1.5 4 0 7l-6 6-5-5zm2.5 2.5a2 2 0 1 0 0 .01zM9 12l3 3-1 3-3-3zM6 16l2 2-4 3z"/></symbol>
+        <symbol id="i-chart-bar" viewBox="0 0 24 24"><path d="M3 3h2v16h16v2H3zm4 9h3v6H7zm5-5h3v11h-3zm5 3h3v8h-3z"/></symbol>
+        <symbol id="i-shield" viewBox="0 0 24 24"><path d="M12 2 4 5v6c0 5 3.4 9.7 8 11 4.6-1.3 8-6 8-11V5z"/></symbol>
+        <symbol id="i-lightbulb" viewBox="0 0 24 24"><path d="M12 2a7 7 0 0 0-4 12.7V17h8v-2.3A7 7 0 0 0 12 2zM9 19h6v1a2 2 0 0 1-2 2h-2a2 2 0 0 1-2-2z"/></symbol>
+        <symbol id="i-check" viewBox="0 0 24 24"><path d="m9 16.2-4.2-4.2-1.4 1.4L9 19 21 7l-1.4-1.4z"/></symbol>
+        <symbol id="i-warning" viewBox="0 0 24 24"><path d="M1 21h22L12 2zm12-3h-2v-2h2zm0-4h-2v-4h2z"/></symbol>
+    </svg>
+    <div class="main-container">
+        <div class="header">
+            <h1><svg class="icon me-3"><use href="#i-chart-line"/></svg>BWGA Nexus Investment Intelligence</h1>
+            <p>Advanced algorithmic analysis with real-time insights</p>
+        </div>
+        
+        <div class="content">
+            <div class="row">
+                <div class="col-lg-6">
+                    <div class="card mb-4">
+                        <div class="card-header">
+                            <h5 class="mb-0"><svg class="icon me-2"><use href="#i-calculator"/></svg>Investment Analysis</h5>
+                        </div>
+                        <div class="card-body">
+                            <form id="analysisForm">
+                                <div class="row">
+                                    <div class="col-md-6 mb-3">
+                                        <label class="form-label">Company Type</label>
+                                        <select class="form-select" id="companyType" required>
+                                            <option value="">Select Type</option>
+                                            <option value="technology">Technology</option>
+                                            <option value="manufacturing">Manufacturing</option>
+                                            <option value="finance">Finance</option>
+                                            <option value="logistics">Logistics</option>
+                                        </select>
+                                    </div>
+                                    <div class="col-md-6 mb-3">
+                                        <label class="form-label">Investment Size</label>
+                                        <select class="form-select" id="investmentSize" required>
+                                            <option value="">Select Size</option>
+                                            <option value="small">Small ($1M - $10M)</option>
+                                            <option value="medium">Medium ($10M - $100M)</option>
+                                            <option value="large">Large ($100M+)</option>
+                                        </select>
+                                    </div>
+                                </div>
+                                
+                                <div class="row">
+                                    <div class="col-md-6 mb-3">
+                                        <label class="form-label">Risk Tolerance</label>
+                                        <select class="form-select" id="riskTolerance" required>
+                                            <option value="">Select Risk Level</option>
+                                            <option value="low">Conservative</option>
+                                            <option value="medium">Moderate</option>
+                                            <option value="high">Aggressive</option>
+                                        </select>
+                                    </div>
+                                    <div class="col-md-6 mb-3">
+                                        <label class="form-label">Target Region</label>
+                                        <select class="form-select" id="region" required>
+                                            <option value="">Select Region</option>
+                                            <option value="North America">North America</option>
+                                            <option value="Europe">Europe</option>
+                                            <option value="Asia Pacific">Asia Pacific</option>
+                                        </select>
+                                    </div>
+                                </div>
+
+                                <div class="mb-3">
+                                    <label class="form-label">Target City</label>
+                                    <input type="text" class="form-control" id="city" placeholder="e.g., Austin, Texas" required>
+                                </div>
+
+                                <button type="submit" class="btn btn-primary w-100">
+                                    <svg class="icon me-2"><use href="#i-rocket"/></svg>Run Complete Analysis
+                                </button>
+                            </form>
+                        </div>
+                    </div>
+                </div>
+
+                <div class="col-lg-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5 class="mb-0"><svg class="icon me-2"><use href="#i-chart-bar"/></svg>Analysis Results</h5>
+                        </div>
+                        <div class="card-body">
+                            <div class="loading" id="loadingState">
+                                <div class="spinner"></div>
+                                <p>Running advanced algorithm analysis...</p>
+                            </div>
+
+                            <div id="resultsDisplay" style="display: none;">
+                                <div class="text-center mb-4">
+                                    <div class="score-display" id="compositeScore">--</div>
+                                    <div class="tier-badge" id="tierBadge">--</div>
+                                </div>
+
+                                <div class="row mb-4">
+                                    <div class="col-6">
+                                        <div class="text-center">
+                                            <div class="metric-value" id="projectedROI">--</div>
+                                            <small class="text-muted">Projected ROI</small>
+                                        </div>
+                                    </div>
+                                    <div class="col-6">
+                                        <div class="text-center">
+                                            <div class="metric-value" id="annualSavings">--</div>
+                                            <small class="text-muted">Annual Savings</small>
+                                        </div>
+                                    </div>
+                                </div>
+
+                                <div class="alert alert-info">
+                                    <h6><svg class="icon me-2"><use href="#i-shield"/></svg>Risk Assessment</h6>
+                                    <div id="riskDetails">--</div>
+                                </div>
+
+                                <div class="alert alert-success">
+                                    <h6><svg class="icon me-2"><use href="#i-lightbulb"/></svg>Recommendations</h6>
+                                    <div id="recommendations">--</div>
+                                </div>
+                            </div>
+
+                            <div id="initialState" class="text-center text-muted">
+                                <svg class="icon icon-3x mb-3"><use href="#i-chart-line"/></svg>
+                                <h5>Ready for Analysis</h5>
+                                <p>Fill out the form and click "Run Complete Analysis" to get started</p>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        document.getElementById('analysisForm').addEventListener('submit', async function(e) {
+            e.preventDefault();
+            
+            const formData = {
+                company_type: document.getElementById('companyType').value,
+                investment_size: document.getElementById('investmentSize').value,
+                risk_tolerance: document.getElementById('riskTolerance').value,
+                preferred_region: document.getElementById('region').value,
+                city: document.getElementById('city').value,
+                industry_focus: document.getElementById('companyType').value
+            };
+
+            // Show loading
+            document.getElementById('loadingState').style.display = 'block';
+            document.getElementById('resultsDisplay').style.display = 'none';
+            document.getElementById('initialState').style.display = 'none';
+
+            try {
+                const response = await fetch('/api/v1/analyze/investment', {
+                    method: 'POST',
+                    headers: {'Content-Type': 'application/json'},
+                    body: JSON.stringify(formData)
+                });
+                
+                const data = await response.json();
+                
+                if (data.success) {
+                    displayResults(data.analysis_result);
+                } else {
+                    showError(data.message || 'Analysis failed');
+                }
+            } catch (error) {
+                showError('Connection error. Please try again.');
+            } finally {
+                document.getElementById('loadingState').style.display = 'none';
+            }
+        });
+
+        function displayResults(result) {
+            document.getElementById('resultsDisplay').style.display = 'block';
+            document.getElementById('initialState').style.display = 'none';
+
+            document.getElementById('compositeScore').textContent = result.composite_score;
+            
+            const tierBadge = document.getElementById('tierBadge');
+            tierBadge.textContent = result.tier_level;
+            tierBadge.className = 'tier-badge ' + (TIER_CLASS[result.tier_level] || 'tier-premium');
+
+            document.getElementById('projectedROI').textContent = result.roi_projection.projected_roi + '%';
+            document.getElementById('annualSavings').textContent = '$' + (result.cost_savings.annual_savings / 1000000).toFixed(1) + 'M';
+
+            document.getElementById('riskDetails').innerHTML = `
+                <strong>Risk Level:</strong> ${result.risk_assessment.risk_level}<br>
+                <strong>Risk Score:</strong> ${result.risk_assessment.risk_score}/100<br>
+                <strong>Break-even:</strong> ${result.roi_projection.break_even_months} months
+            `;
+
+            const recommendations = result.recommendations || [
+                'Consider phased investment approach',
+                'Monitor market conditions closely',
+                'Establish risk mitigation strategies'
+            ];
+            
+            document.getElementById('recommendations').innerHTML = 
+                recommendations.map(rec => `<div class="mb-2"><svg class="icon me-2"><use href="#i-check"/></svg>${rec}</div>`).join('');
+        }
+
+        // Badge class per tier key (result.tier_level is the InvestmentTier name)
+        const TIER_CLASS = {TIER_1: 'tier-premium', TIER_2: 'tier-strategic', TIER_3: 'tier-emerging'};
+
+        function showError(message) {
+            document.getElementById('resultsDisplay').style.display = 'none';
+            document.getElementById('initialState').style.display = 'block';
+            
+            const alertDiv = document.createElement('div');
+            alertDiv.className = 'alert alert-danger alert-dismissible';
+            alertDiv.innerHTML = `
+                <svg class="icon me-2"><use href="#i-warning"/></svg>${message}
+                <button type="button" class="btn-close" aria-label="Close" onclick="this.parentElement.remove()">&times;</button>
+            `;
+            
+            document.querySelector('.content').insertBefore(alertDiv, document.querySelector('.content').firstChild);
+        }
+    </script>
+</body>
+</html>
+"""
+
+# The dashboard has no template variables, so serve it verbatim,
+# precompressed, with a strong ETag per encoding for 304 revalidation
+_DASHBOARD_HTML = get_dashboard_html()
+_HTML_BYTES = _DASHBOARD_HTML.encode('utf-8')
+_HTML_GZ = gzip.compress(_HTML_BYTES, 9)
+_HTML_HASH = hashlib.blake2b(_HTML_BYTES, digest_size=8).hexdigest()
+_HTML_ETAG = '"%s"' % _HTML_HASH
+_HTML_GZ_ETAG = '"%s-gzip"' % _HTML_HASH
+
+def main():
+    """Main function to run the application"""
+    print("🌍 Starting BWGA Nexus Investment Intelligence Platform...")
+    print("Version: 7.1.0")
+    print("Environment: Production (Unified System)")
+    print("-" * 50)
+    
+    if ALGORITHM_AVAILABLE:
+        print("✅ Investment algorithm loaded successfully!")
+    else:
+        print("❌ Investment algorithm not available")
+    
+    print("🌍 BWGA Nexus Investment Intelligence Platform")
+    print("Version: 7.1.0")
+    print("Algorithm Status: Active" if ALGORITHM_AVAILABLE else "Algorithm Status: Not Available")
+    print("Server running at: http://localhost:8000")
+    print("Dashboard: http://localhost:8000")
+    print("API Health: http://localhost:8000/api/v1/health")
+    print("System Info: http://localhost:8000/api/v1/system-info")
+    print("Press Ctrl+C to stop the server")
+    print("-" * 50)
+    
+    # Run under a production WSGI server: gunicorn (one worker per core) on
+    # POSIX, waitress on Windows, the Flask dev server as a last resort.
+    # `algorithm` is read-only after init, so sharing it across workers is safe.
+    workers = os.cpu_count() or 1
+    if os.name != 'nt' and shutil.which('gunicorn'):
+        os.execvp('gunicorn', [
+            'gunicorn', '-w', str(workers), '-k', 'gthread', '--threads', '4',
+            '-b', '0.0.0.0:8000', '--chdir', str(Path(__file__).parent), 'app:app'
+        ])
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host='0.0.0.0', port=8000, debug=False)
+    else:
+        serve(app, host='0.0.0.0', port=8000, threads=workers * 4)
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
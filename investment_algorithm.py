@@ -8,12 +8,23 @@ Based on factual insights, predictive analytics, and 3-tier reporting system
 import math
 import json
 import random
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import numpy as np
 
+# Optional JIT for the scoring kernel; falls back to plain Python/NumPy
+try:
+    import numba
+    # nogil lets request threads in one server process run kernels concurrently
+    _njit = numba.njit(cache=True, fastmath=True, nogil=True)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _njit = lambda f: f
+    NUMBA_AVAILABLE = False
+
 class InvestmentTier(Enum):
     TIER_1 = "Tier 1 - Premium Investment"
     TIER_2 = "Tier 2 - Strategic Investment" 
@@ -35,7 +46,10 @@ class IndustryType(Enum):
     RETAIL = "Retail & E-commerce"
     REAL_ESTATE = "Real Estate & Construction"
 
-@dataclass
+# __slots__ on the input dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class RegionalMetrics:
     """Enhanced core metrics for regional analysis"""
     city: str
@@ -61,7 +75,7 @@ class RegionalMetrics:
     geopolitical_risk: float
     market_volatility: float
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CompanyProfile:
     """Enhanced company investment profile"""
     company_type: str
@@ -94,6 +108,166 @@ class AlgorithmResult:
     market_insights: Dict[str, Any]
     competitive_analysis: Dict[str, Any]
 
+# Fixed component order shared by the weights, multipliers and the kernel
+COMPONENT_ORDER = (
+    'infrastructure', 'talent', 'cost_efficiency', 'market_access',
+    'regulatory', 'political_stability', 'growth_potential', 'risk_factors',
+    'digital_readiness', 'sustainability', 'innovation', 'supply_chain'
+)
+
+# Numeric RegionalMetrics fields, packed in this order for the kernel
+METRIC_FIELDS = (
+    'population', 'gdp_per_capita', 'infrastructure_score', 'talent_availability',
+    'cost_of_living', 'tax_rate', 'regulatory_ease', 'market_access',
+    'political_stability', 'growth_rate', 'inflation_rate', 'currency_stability',
+    'digital_infrastructure', 'supply_chain_efficiency', 'innovation_index',
+    'sustainability_score', 'geopolitical_risk', 'market_volatility'
+)
+
+# Categorical adjustments, resolved to floats before entering the kernel
+_TALENT_FACTORS = {'tech': 1.2, 'manufacturing': 0.9}
+_SIZE_FACTORS = {'large': 1.1, 'small': 0.9}
+_REGION_BONUSES = {'asia-pacific': 10.0, 'europe': 8.0, 'americas': 6.0}
+_RISK_TOLERANCE_FACTORS = {'low': 1.2, 'high': 0.8}
+
+@_njit
+def _clamp(x: float) -> float:
+    return max(0.0, min(100.0, x))
+
+@_njit
+def _fill_component_scores(metrics: np.ndarray, multipliers: np.ndarray,
+                           params: np.ndarray, scores: np.ndarray) -> None:
+    """
+    Write the 12 component scores (0-100, COMPONENT_ORDER) into scores.
+    metrics: METRIC_FIELDS values; multipliers: industry multipliers per component;
+    params: (talent factor, investment size factor, region bonus, risk tolerance factor)
+    """
+    population = metrics[0]
+    gdp_per_capita = metrics[1]
+    infrastructure = metrics[2]
+    talent = metrics[3]
+    cost_of_living = metrics[4]
+    tax_rate = metrics[5]
+    regulatory_ease = metrics[6]
+    market_access = metrics[7]
+    political_stability = metrics[8]
+    growth_rate = metrics[9]
+    inflation_rate = metrics[10]
+    currency_stability = metrics[11]
+
+    # Infrastructure readiness: bonus for modern, penalty for poor infrastructure
+    s = infrastructure * 100 * multipliers[0]
+    if infrastructure > 0.8:
+        s += 10
+    if infrastructure < 0.4:
+        s -= 20
+    scores[0] = _clamp(s)
+
+    # Talent: company-type factor, then population size
+    s = talent * 100 * multipliers[1] * params[0]
+    if population > 1000000:
+        s += 5
+    elif population < 100000:
+        s -= 10
+    scores[1] = _clamp(s)
+
+    # Cost efficiency: inverse cost of living (scaled by investment size) averaged with tax efficiency
+    cost_efficiency = (1 - cost_of_living) * 100 * multipliers[2] * params[1]
+    tax_efficiency = (1 - tax_rate) * 100 * multipliers[4]
+    if cost_of_living < 0.3:
+        cost_efficiency += 15
+    elif cost_of_living > 0.7:
+        cost_efficiency -= 10
+    scores[2] = _clamp((cost_efficiency + tax_efficiency) / 2)
+
+    # Market access plus regional market bonus
+    scores[3] = _clamp(market_access * 100 * multipliers[3] + params[2])
+
+    # Regulatory environment
+    s = regulatory_ease * 100 * multipliers[4]
+    if regulatory_ease > 0.7:
+        s += 10
+    elif regulatory_ease < 0.3:
+        s -= 15
+    scores[4] = _clamp(s)
+
+    # Political stability
+    s = political_stability * 100
+    if political_stability > 0.8:
+        s += 10
+    elif political_stability < 0.4:
+        s -= 20
+    scores[5] = _clamp(s)
+
+    # Growth potential: developed markets grow slower, emerging faster; large populations bonus
+    s = growth_rate * 100
+    if gdp_per_capita > 50000:
+        s *= 0.8
+    elif gdp_per_capita < 10000:
+        s *= 1.3
+    if population > 5000000:
+        s += 5
+    scores[6] = _clamp(s)
+
+    # Risk factors (higher is better): currency, inflation, political, then risk tolerance
+    s = 100.0
+    if currency_stability < 0.5:
+        s -= 20
+    if inflation_rate > 0.1:
+        s -= 15
+    if political_stability < 0.5:
+        s -= 25
+    scores[7] = _clamp(s * params[3])
+
+    # Digital readiness, sustainability, innovation, supply chain: placeholder values
+    scores[8] = 50.0
+    scores[9] = 50.0
+    scores[10] = 50.0
+    scores[11] = 50.0
+
+if NUMBA_AVAILABLE:
+    @_njit
+    def _score_kernel(metrics: np.ndarray, multipliers: np.ndarray,
+                      params: np.ndarray, weights: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Compute the component scores for one region and their weighted composite"""
+        scores = np.empty(12)
+        _fill_component_scores(metrics, multipliers, params, scores)
+        composite = 0.0
+        for i in range(12):
+            composite += scores[i] * weights[i]
+        return composite, scores
+    
+    @numba.njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _batch_score_kernel(metrics: np.ndarray, multipliers: np.ndarray,
+                            params: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Score each row of an (N, len(METRIC_FIELDS)) array with per-row params; returns (composites, scores)"""
+        n = metrics.shape[0]
+        composites = np.empty(n)
+        scores = np.empty((n, 12))
+        for i in numba.prange(n):
+            _fill_component_scores(metrics[i], multipliers, params[i], scores[i])
+            composite = 0.0
+            for j in range(12):
+                composite += scores[i, j] * weights[j]
+            composites[i] = composite
+        return composites, scores
+else:
+    def _score_kernel(metrics: np.ndarray, multipliers: np.ndarray,
+                      params: np.ndarray, weights: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Compute the component scores for one region and their weighted composite"""
+        scores = np.empty(12)
+        _fill_component_scores(metrics, multipliers, params, scores)
+        # One dot product instead of 12 interpreted multiply-adds over NumPy scalars
+        return float(weights @ scores), scores
+    
+    def _batch_score_kernel(metrics: np.ndarray, multipliers: np.ndarray,
+                            params: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Score each row of an (N, len(METRIC_FIELDS)) array with per-row params; returns (composites, scores)"""
+        scores = np.empty((metrics.shape[0], 12))
+        for i in range(metrics.shape[0]):
+            _fill_component_scores(metrics[i], multipliers, params[i], scores[i])
+        return scores @ weights, scores
+
 class AdvancedRegionalInvestmentAlgorithm:
     """
     Enhanced algorithmic system for regional investment analysis
@@ -150,6 +324,15 @@ class AdvancedRegionalInvestmentAlgorithm:
                 'market_access': 1.1
             }
         }
+        
+        # Array forms of the weights and per-industry multipliers for the kernel
+        self._component_order = COMPONENT_ORDER
+        self._weights_vec = np.array([self.weights[c] for c in COMPONENT_ORDER], dtype=np.float64)
+        self._industry_mul_vecs = {
+            industry: np.array([multipliers.get(c, 1.0) for c in COMPONENT_ORDER], dtype=np.float64)
+            for industry, multipliers in self.industry_multipliers.items()
+        }
+        self._neutral_mul_vec = np.ones(len(COMPONENT_ORDER), dtype=np.float64)
     
     def calculate_investment_score(self, regional_data: RegionalMetrics, 
                                  company_profile: CompanyProfile) -> AlgorithmResult:
@@ -160,27 +343,17 @@ class AdvancedRegionalInvestmentAlgorithm:
         # Get industry type
         industry_type = self._get_industry_type(company_profile.industry_focus)
         
-        # Calculate all component scores with industry adjustments
-        component_scores = {
-            'infrastructure': self._calculate_infrastructure_score(regional_data, industry_type),
-            'talent': self._calculate_talent_score(regional_data, company_profile, industry_type),
-            'cost_efficiency': self._calculate_cost_efficiency(regional_data, company_profile, industry_type),
-            'market_access': self._calculate_market_access(regional_data, industry_type),
-            'regulatory': self._calculate_regulatory_score(regional_data, industry_type),
-            'political_stability': self._calculate_political_stability(regional_data),
-            'growth_potential': self._calculate_growth_potential(regional_data, company_profile),
-            'risk_factors': self._calculate_risk_factors(regional_data, company_profile),
-            'digital_readiness': self._calculate_digital_readiness(regional_data, company_profile),
-            'sustainability': self._calculate_sustainability_score(regional_data, company_profile),
-            'innovation': self._calculate_innovation_score(regional_data, company_profile),
-            'supply_chain': self._calculate_supply_chain_score(regional_data, company_profile)
-        }
-        
-        # Calculate weighted composite score
-        composite_score = sum(
-            score * self.weights[component] 
-            for component, score in component_scores.items()
-        )
+        # Pack inputs into flat float64 arrays and score them in the kernel
+        metrics = np.array([getattr(regional_data, f) for f in METRIC_FIELDS], dtype=np.float64)
+        params = np.array([
+            _TALENT_FACTORS.get(company_profile.company_type, 1.0),
+            _SIZE_FACTORS.get(company_profile.investment_size, 1.0),
+            _REGION_BONUSES.get(regional_data.region, 0.0),
+            _RISK_TOLERANCE_FACTORS.get(company_profile.risk_tolerance, 1.0)
+        ], dtype=np.float64)
+        multipliers = self._industry_mul_vecs.get(industry_type, self._neutral_mul_vec)
+        composite_score, scores = _score_kernel(metrics, multipliers, params, self._weights_vec)
+        component_scores = dict(zip(self._component_order, scores.tolist()))
         
         # Determine investment tier
         investment_tier = self._determine_investment_tier(composite_score)
@@ -208,6 +381,44 @@ class AdvancedRegionalInvestmentAlgorithm:
             competitive_analysis=competitive_analysis
         )
     
+    def calculate_batch_scores(self, metrics: np.ndarray, regions: List[str],
+                               company_profile: CompanyProfile) -> List[Dict[str, Any]]:
+        """
+        Score many candidate regions for one company in a single kernel call.
+        metrics is an (N, len(METRIC_FIELDS)) array in METRIC_FIELDS column order;
+        regions holds each row's region name
+        """
+        industry_type = self._get_industry_type(company_profile.industry_focus)
+        multipliers = self._industry_mul_vecs.get(industry_type, self._neutral_mul_vec)
+        
+        params = np.empty((len(regions), 4), dtype=np.float64)
+        params[:, 0] = _TALENT_FACTORS.get(company_profile.company_type, 1.0)
+        params[:, 1] = _SIZE_FACTORS.get(company_profile.investment_size, 1.0)
+        params[:, 2] = [_REGION_BONUSES.get(region, 0.0) for region in regions]
+        params[:, 3] = _RISK_TOLERANCE_FACTORS.get(company_profile.risk_tolerance, 1.0)
+        
+        composites, scores = _batch_score_kernel(
+            np.ascontiguousarray(metrics, dtype=np.float64), multipliers, params, self._weights_vec
+        )
+        
+        results = []
+        for composite, row in zip(composites.tolist(), scores.tolist()):
+            investment_tier = self._determine_investment_tier(composite)
+            results.append({
+                'composite_score': round(composite, 2),
+                'investment_tier': investment_tier.value,
+                'tier_level': investment_tier.name,
+                'component_scores': {k: round(v, 2) for k, v in zip(self._component_order, row)}
+            })
+        return results
+    
+    def warm_up(self) -> None:
+        """Compile (or load the cached) scoring kernels ahead of the first real analysis"""
+        _score_kernel(np.zeros(len(METRIC_FIELDS)), self._neutral_mul_vec,
+                      np.ones(4), self._weights_vec)
+        _batch_score_kernel(np.zeros((1, len(METRIC_FIELDS))), self._neutral_mul_vec,
+                            np.ones((1, 4)), self._weights_vec)
+    
     def _get_industry_type(self, industry_focus: str) -> IndustryType:
         """Map industry focus to IndustryType enum"""
         industry_mapping = {
@@ -223,200 +434,6 @@ class AdvancedRegionalInvestmentAlgorithm:
         }
         return industry_mapping.get(industry_focus.lower(), IndustryType.MANUFACTURING)
     
-    def _apply_industry_multiplier(self, base_score: float, component: str, industry_type: IndustryType) -> float:
-        """Apply industry-specific multipliers to component scores"""
-        if industry_type in self.industry_multipliers and component in self.industry_multipliers[industry_type]:
-            return base_score * self.industry_multipliers[industry_type][component]
-        return base_score
-    
-    def _calculate_infrastructure_score(self, regional_data: RegionalMetrics, industry_type: IndustryType) -> float:
-        """
-        Calculate infrastructure readiness score (0-100)
-        Based on transportation, utilities, digital infrastructure
-        """
-        base_score = self._apply_industry_multiplier(regional_data.infrastructure_score * 100, 'infrastructure', industry_type)
-        
-        # Bonus for modern infrastructure
-        if regional_data.infrastructure_score > 0.8:
-            base_score += 10
-        
-        # Penalty for poor infrastructure
-        if regional_data.infrastructure_score < 0.4:
-            base_score -= 20
-            
-        return max(0, min(100, base_score))
-    
-    def _calculate_talent_score(self, regional_data: RegionalMetrics, 
-                               company_profile: CompanyProfile, industry_type: IndustryType) -> float:
-        """
-        Calculate talent availability and quality score (0-100)
-        """
-        base_score = self._apply_industry_multiplier(regional_data.talent_availability * 100, 'talent', industry_type)
-        
-        # Industry-specific talent adjustments
-        if company_profile.company_type == 'tech':
-            base_score *= 1.2  # Tech companies need high talent
-        elif company_profile.company_type == 'manufacturing':
-            base_score *= 0.9  # Manufacturing can work with moderate talent
-        
-        # Population factor
-        if regional_data.population > 1000000:
-            base_score += 5
-        elif regional_data.population < 100000:
-            base_score -= 10
-            
-        return max(0, min(100, base_score))
-    
-    def _calculate_cost_efficiency(self, regional_data: RegionalMetrics,
-                                 company_profile: CompanyProfile, industry_type: IndustryType) -> float:
-        """
-        Calculate cost efficiency score (0-100)
-        Based on cost of living, taxes, operational costs
-        """
-        # Base cost efficiency (inverse of cost of living)
-        cost_efficiency = self._apply_industry_multiplier((1 - regional_data.cost_of_living) * 100, 'cost_efficiency', industry_type)
-        
-        # Tax efficiency
-        tax_efficiency = self._apply_industry_multiplier((1 - regional_data.tax_rate) * 100, 'regulatory', industry_type)
-        
-        # Investment size adjustments
-        if company_profile.investment_size == 'large':
-            cost_efficiency *= 1.1  # Large investments benefit more from cost savings
-        elif company_profile.investment_size == 'small':
-            cost_efficiency *= 0.9  # Small investments less sensitive to costs
-            
-        # Regional cost advantages
-        if regional_data.cost_of_living < 0.3:
-            cost_efficiency += 15  # Very low cost regions
-        elif regional_data.cost_of_living > 0.7:
-            cost_efficiency -= 10  # High cost regions
-            
-        return max(0, min(100, (cost_efficiency + tax_efficiency) / 2))
-    
-    def _calculate_market_access(self, regional_data: RegionalMetrics, industry_type: IndustryType) -> float:
-        """
-        Calculate market access score (0-100)
-        Based on proximity to major markets, trade agreements
-        """
-        base_score = self._apply_industry_multiplier(regional_data.market_access * 100, 'market_access', industry_type)
-        
-        # Regional market access bonuses
-        if regional_data.region == 'asia-pacific':
-            base_score += 10  # Access to growing Asian markets
-        elif regional_data.region == 'europe':
-            base_score += 8   # Access to EU market
-        elif regional_data.region == 'americas':
-            base_score += 6   # Access to NAFTA/USMCA markets
-            
-        return max(0, min(100, base_score))
-    
-    def _calculate_regulatory_score(self, regional_data: RegionalMetrics, industry_type: IndustryType) -> float:
-        """
-        Calculate regulatory environment score (0-100)
-        """
-        base_score = self._apply_industry_multiplier(regional_data.regulatory_ease * 100, 'regulatory', industry_type)
-        
-        # Regulatory stability bonus
-        if regional_data.regulatory_ease > 0.7:
-            base_score += 10
-        elif regional_data.regulatory_ease < 0.3:
-            base_score -= 15
-            
-        return max(0, min(100, base_score))
-    
-    def _calculate_political_stability(self, regional_data: RegionalMetrics) -> float:
-        """
-        Calculate political stability score (0-100)
-        """
-        base_score = regional_data.political_stability * 100
-        
-        # Stability bonuses/penalties
-        if regional_data.political_stability > 0.8:
-            base_score += 10
-        elif regional_data.political_stability < 0.4:
-            base_score -= 20
-            
-        return max(0, min(100, base_score))
-    
-    def _calculate_growth_potential(self, regional_data: RegionalMetrics,
-                               company_profile: CompanyProfile) -> float:
-        """
-        Calculate growth potential score (0-100)
-        Based on GDP growth, population growth, market expansion
-        """
-        growth_score = regional_data.growth_rate * 100
-        
-        # GDP per capita factor
-        if regional_data.gdp_per_capita > 50000:
-            growth_score *= 0.8  # Developed markets have lower growth potential
-        elif regional_data.gdp_per_capita < 10000:
-            growth_score *= 1.3  # Emerging markets have higher growth potential
-            
-        # Population growth factor
-        if regional_data.population > 5000000:
-            growth_score += 5  # Large population markets
-            
-        return max(0, min(100, growth_score))
-    
-    def _calculate_risk_factors(self, regional_data: RegionalMetrics,
-                               company_profile: CompanyProfile) -> float:
-        """
-        Calculate risk factor score (0-100) - Higher is better (lower risk)
-        """
-        risk_score = 100
-        
-        # Currency risk
-        if regional_data.currency_stability < 0.5:
-            risk_score -= 20
-            
-        # Inflation risk
-        if regional_data.inflation_rate > 0.1:
-            risk_score -= 15
-            
-        # Political risk
-        if regional_data.political_stability < 0.5:
-            risk_score -= 25
-            
-        # Company-specific risk tolerance
-        if company_profile.risk_tolerance == 'low':
-            risk_score *= 1.2  # Low risk tolerance companies get bonus
-        elif company_profile.risk_tolerance == 'high':
-            risk_score *= 0.8  # High risk tolerance companies accept more risk
-            
-        return max(0, min(100, risk_score))
-    
-    def _calculate_digital_readiness(self, regional_data: RegionalMetrics,
-                                    company_profile: CompanyProfile) -> float:
-        """
-        Calculate digital readiness score (0-100)
-        """
-        # Placeholder for digital readiness calculation
-        return 50  # Placeholder value
-    
-    def _calculate_sustainability_score(self, regional_data: RegionalMetrics,
-                                        company_profile: CompanyProfile) -> float:
-        """
-        Calculate sustainability score (0-100)
-        """
-        # Placeholder for sustainability calculation
-        return 50  # Placeholder value
-    
-    def _calculate_innovation_score(self, regional_data: RegionalMetrics,
-                                   company_profile: CompanyProfile) -> float:
-        """
-        Calculate innovation score (0-100)
-        """
-        # Placeholder for innovation calculation
-        return 50  # Placeholder value
-    
-    def _calculate_supply_chain_score(self, regional_data: RegionalMetrics,
-                                      company_profile: CompanyProfile) -> float:
-        """
-        Calculate supply chain score (0-100)
-        """
-        # Placeholder for supply chain calculation
-        return 50  # Placeholder value
-    
     def _determine_investment_tier(self, composite_score: float) -> InvestmentTier:
         """
         Determine investment tier based on composite score